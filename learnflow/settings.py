@@ -83,10 +83,18 @@ DATABASES = {
         "USER":env("DB_USER"),
         "PASSWORD":env("DB_PASSWORD"),
         'HOST':env("DB_HOST"),
-        "PORT":env("DB_PORT")
+        "PORT":env("DB_PORT"),
+        # Seconds to reuse a connection across requests. Set DB_CONN_MAX_AGE
+        # (e.g. 60) under WSGI; keep 0 under ASGI, where Django says
+        # persistent connections should be disabled.
+        "CONN_MAX_AGE": env.int("DB_CONN_MAX_AGE", default=0),
+        "CONN_HEALTH_CHECKS": True,
     }
 }
 
+# Google Gemini key for the AI plan generator; the endpoint answers 500 without it
+GEMINI_API_KEY = env("GEMINI_API_KEY", default=None)
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -117,11 +125,12 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # Django REST Framework settings (simple defaults)
 REST_FRAMEWORK = {
+    # orjson drop-ins for JSONRenderer / JSONParser (faster, fewer allocations)
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'planner.renderers.ORJSONRenderer',
     ],
     'DEFAULT_PARSER_CLASSES': [
-        'rest_framework.parsers.JSONParser',
+        'planner.parsers.ORJSONParser',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.AllowAny',
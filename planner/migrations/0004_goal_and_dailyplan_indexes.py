@@ -0,0 +1,25 @@
+# Generated by Django 5.2.8 on 2026-10-14 18:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('planner', '0003_alter_goal_title_alter_goal_unique_together'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='dailyplan',
+            index=models.Index(fields=['date'], name='planner_dai_date_56df96_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='dailyplan',
+            index=models.Index(fields=['user', 'date'], name='planner_dai_user_id_98ff7c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='goal',
+            index=models.Index(fields=['-created_at'], name='planner_goa_created_fb6926_idx'),
+        ),
+    ]
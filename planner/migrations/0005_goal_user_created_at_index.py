@@ -0,0 +1,21 @@
+# Generated by Django 5.2.8 on 2026-10-14 18:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('planner', '0004_goal_and_dailyplan_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='goal',
+            name='planner_goa_created_fb6926_idx',
+        ),
+        migrations.AddIndex(
+            model_name='goal',
+            index=models.Index(fields=['user', '-created_at'], name='planner_goa_user_id_ac1ec4_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8 on 2026-10-14 18:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('planner', '0005_goal_user_created_at_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='goal',
+            index=models.Index(fields=['user', 'updated_at'], name='planner_goa_user_id_e8fd3d_idx'),
+        ),
+    ]
@@ -1,14 +1,6 @@
-
-
-
-
-
-#------------------------------------------------
-#-----------------------------------------------
-
-
 from django.db import models
-from django.contrib.auth.hashers import make_password
+from django.contrib.auth.hashers import make_password, check_password, identify_hasher
+from django.utils.crypto import constant_time_compare
 
 
 class UserRegistration(models.Model):
@@ -17,6 +9,26 @@ class UserRegistration(models.Model):
     password = models.CharField(max_length=255)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    def set_password(self, raw_password):
+        self.password = make_password(raw_password)
+
+    def check_password(self, raw_password):
+        def setter(raw_password):
+            self.set_password(raw_password)
+            self.save(update_fields=["password"])
+
+        try:
+            identify_hasher(self.password)
+        except ValueError:
+            # Accounts registered before hashing was added still hold the
+            # raw password: compare it once, then store a proper hash.
+            if not constant_time_compare(self.password, raw_password):
+                return False
+            setter(raw_password)
+            return True
+        # setter re-hashes when PASSWORD_HASHERS or its work factor changed
+        return check_password(raw_password, self.password, setter)
+
     def __str__(self):
         return self.email
 
@@ -36,6 +48,15 @@ class Goal(models.Model):
 
     class Meta:
         unique_together = ("user", "title")
+        indexes = [
+            models.Index(fields=["user", "-created_at"]),
+            # Covers the list ETag's COUNT/MAX(updated_at) per user
+            models.Index(fields=["user", "updated_at"]),
+        ]
+
+    @property
+    def status(self):
+        return "Completed" if self.is_completed else "In Progress"
 
     def save(self, *args, **kwargs):
         self.title = self.title.lower().strip()
@@ -66,5 +87,11 @@ class DailyPlan(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["date"]),
+            models.Index(fields=["user", "date"]),
+        ]
+
     def __str__(self):
         return f"Plan for {self.date}"
@@ -0,0 +1,24 @@
+"""Pagination classes for the list endpoints.
+
+Both are opt-in: without `?page_size=` the endpoints keep returning a
+plain JSON array, which is what the frontend expects today. Cursor
+pagination is used so large tables never pay for COUNT(*) or OFFSET scans.
+"""
+
+from rest_framework.pagination import CursorPagination
+
+
+class GoalPagination(CursorPagination):
+    """`?page_size=20` cursor paging for goals, newest first."""
+    page_size = None
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = ('-created_at', '-id')
+
+
+class DailyPlanPagination(CursorPagination):
+    """`?page_size=50` cursor paging for daily plans, ordered by date."""
+    page_size = None
+    page_size_query_param = 'page_size'
+    max_page_size = 200
+    ordering = ('date', 'id')
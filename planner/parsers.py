@@ -0,0 +1,19 @@
+"""orjson-backed JSON parser for the API (see `REST_FRAMEWORK` settings)."""
+
+import orjson
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+from .renderers import ORJSONRenderer
+
+
+class ORJSONParser(BaseParser):
+    """Drop-in for DRF's JSONParser."""
+    media_type = 'application/json'
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
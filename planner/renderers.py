@@ -0,0 +1,20 @@
+"""orjson-backed JSON renderer for the API (see `REST_FRAMEWORK` settings)."""
+
+import orjson
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# Types orjson doesn't know (Decimal, lazy strings, ...) fall back to DRF's encoder
+_drf_default = JSONEncoder().default
+
+
+class ORJSONRenderer(BaseRenderer):
+    """Drop-in for DRF's JSONRenderer; `OPT_UTC_Z` keeps DRF's `...Z` datetimes."""
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return orjson.dumps(data, default=_drf_default, option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS)
@@ -1,12 +1,24 @@
 """Serializers convert model instances to/from JSON for the API."""
 
+from django.db import connection, transaction
 from rest_framework import serializers
 from .models import Goal, DailyPlan
 
 
-class GoalSerializer(serializers.ModelSerializer):
+class UpdateFieldsMixin:
+    """Limit the UPDATE to the columns the request actually changed."""
+
+    def update(self, instance, validated_data):
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        # auto_now only reaches the row when listed in update_fields
+        instance.save(update_fields=[*validated_data, "updated_at"])
+        return instance
+
+
+class GoalSerializer(UpdateFieldsMixin, serializers.ModelSerializer):
     """Serializer for the Goal model."""
-    status = serializers.SerializerMethodField()
+    status = serializers.ReadOnlyField()
     class Meta:
         model = Goal
         fields = [
@@ -22,8 +34,22 @@ class GoalSerializer(serializers.ModelSerializer):
             'updated_at',
         ]
         read_only_fields = ['status', 'created_at', 'updated_at']
-    def get_status(self, obj):
-        return "Completed" if obj.is_completed else "In Progress"
+
+
+class LoggedInUserDefault:
+    """Default for a read-only `user` field: the `user` in serializer context."""
+    requires_context = True
+
+    def __call__(self, serializer_field):
+        return serializer_field.context["user"]
+
+
+class GoalUpdateSerializer(GoalSerializer):
+    """GoalSerializer for PUT/PATCH: the owner is set by the view, not the payload.
+
+    The default keeps `user` in the (user, title) uniqueness check.
+    """
+    user = serializers.PrimaryKeyRelatedField(read_only=True, default=LoggedInUserDefault())
 
 # class DailyPlanSerializer(serializers.ModelSerializer):
 #     """Serializer for the DailyPlan model."""
@@ -54,17 +80,60 @@ from rest_framework import serializers
 from .models import DailyPlan, Goal
 
 
-class DailyPlanSerializer(serializers.ModelSerializer):
+class DailyPlanListSerializer(serializers.ListSerializer):
+    """Creates a batch of daily plans, with one bulk INSERT where ids come back."""
+
+    def create(self, validated_data):
+        plans = [DailyPlan(**attrs) for attrs in validated_data]
+        with transaction.atomic():
+            if connection.features.can_return_rows_from_bulk_insert:
+                DailyPlan.objects.bulk_create(plans, batch_size=500)
+            else:
+                # MySQL returns no ids from a multi-row INSERT; one INSERT
+                # per row ties each id to its own statement
+                for plan in plans:
+                    plan.save(force_insert=True)
+        return plans
+
+
+class DailyPlanSerializer(UpdateFieldsMixin, serializers.ModelSerializer):
     goal_title = serializers.CharField(source="goal.title", read_only=True)
 
     class Meta:
         model = DailyPlan
+        list_serializer_class = DailyPlanListSerializer
         fields = [
             "id",
             "date",
+            "goal",
             "goal_title",
             "topics",
             "planned_hours",
             "is_completed"
         ]
 
+    def validate_goal(self, goal):
+        user = self.context.get("user")
+        if goal and user and goal.user_id != user.id:
+            raise serializers.ValidationError("Goal not found")
+        return goal
+
+
+class AIGeneratePlanRequestSerializer(serializers.Serializer):
+    """Validates and coerces the ai_generate_plan request body."""
+    goal_id = serializers.IntegerField(min_value=1)
+    days = serializers.IntegerField(min_value=1, max_value=365)
+    stream = serializers.BooleanField(default=False)
+
+
+class RegisterRequestSerializer(serializers.Serializer):
+    """Shape check for the register_user body; values are kept verbatim."""
+    name = serializers.CharField(trim_whitespace=False)
+    email = serializers.CharField(trim_whitespace=False)
+    password = serializers.CharField(trim_whitespace=False)
+
+
+class LoginRequestSerializer(serializers.Serializer):
+    """Shape check for the login_user body; values are kept verbatim."""
+    email = serializers.CharField(trim_whitespace=False)
+    password = serializers.CharField(trim_whitespace=False)
@@ -4,11 +4,22 @@ In a hackathon you may not have time for full coverage, but even a few
 tests show professionalism and help prevent regressions.
 """
 
+import json
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
 from django.urls import reverse
 from rest_framework.test import APITestCase
 from rest_framework import status
 
-from .models import Goal
+from .models import UserRegistration, Goal, DailyPlan
+from .serializers import GoalSerializer, DailyPlanSerializer
+
+
+def streamed_json(response):
+    return json.loads(b"".join(response))
 
 
 class GoalApiTests(APITestCase):
@@ -36,3 +47,478 @@ class GoalApiTests(APITestCase):
         response = self.client.post(url, payload, format='json')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertTrue(len(response.data) >= 1)
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class LoggedInApiTestCase(APITestCase):
+    """Registers and logs in a user so the auth cookie is set on the client."""
+
+    def setUp(self):
+        self.client.post(reverse('register'), {
+            "name": "Test User",
+            "email": "test@example.com",
+            "password": "s3cret-pass",
+        }, format='json')
+        self.client.post(reverse('login'), {
+            "email": "test@example.com",
+            "password": "s3cret-pass",
+        }, format='json')
+        self.user = UserRegistration.objects.get(email="test@example.com")
+
+
+class PasswordHashingTests(LoggedInApiTestCase):
+    def test_password_is_stored_hashed(self):
+        self.assertNotEqual(self.user.password, "s3cret-pass")
+        self.assertTrue(self.user.check_password("s3cret-pass"))
+        self.assertFalse(self.user.check_password("wrong"))
+
+    def test_legacy_plaintext_password_is_upgraded_on_login(self):
+        UserRegistration.objects.create(name="Old", email="old@example.com", password="plain")
+        response = self.client.post(reverse('login'), {
+            "email": "old@example.com",
+            "password": "plain",
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(UserRegistration.objects.get(email="old@example.com").password, "plain")
+
+    @override_settings(PASSWORD_HASHERS=[
+        'django.contrib.auth.hashers.ScryptPasswordHasher',
+        'django.contrib.auth.hashers.MD5PasswordHasher',
+    ])
+    def test_outdated_hash_is_upgraded_on_login(self):
+        response = self.client.post(reverse('login'), {
+            "email": "test@example.com",
+            "password": "s3cret-pass",
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.password.startswith("scrypt$"))
+
+
+class RegistrationTests(LoggedInApiTestCase):
+    def test_duplicate_email_is_a_400(self):
+        response = self.client.post(reverse('register'), {
+            "name": "Again",
+            "email": "test@example.com",
+            "password": "another-pass",
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json(), {"error": "Email already registered"})
+        self.assertEqual(UserRegistration.objects.filter(email="test@example.com").count(), 1)
+
+    def test_non_object_bodies_are_a_400(self):
+        for name in ('register', 'login'):
+            response = self.client.post(reverse(name), [1], format='json')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn("error", response.json())
+
+
+class JsonCodecTests(LoggedInApiTestCase):
+    def test_malformed_json_is_a_400(self):
+        response = self.client.post(reverse('login'), data=b'{"email": ', content_type='application/json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_list_and_detail_render_the_same_json(self):
+        goal = Goal.objects.create(user=self.user, title="Python", deadline="2025-12-31")
+        row = self.client.get(reverse('goals')).json()[0]
+        self.assertEqual(row, self.client.get(reverse('goal-detail', args=[goal.id])).json())
+        self.assertEqual(row["deadline"], "2025-12-31")
+
+
+class OwnershipTests(LoggedInApiTestCase):
+    def test_detail_views_hide_other_users_rows(self):
+        other = UserRegistration.objects.create(name="Other", email="other@example.com", password="x")
+        goal = Goal.objects.create(user=other, title="Private", deadline="2025-12-31")
+        plan = DailyPlan.objects.create(user=other, goal=goal, date="2025-12-01", topics="secret")
+
+        self.assertEqual(self.client.get(reverse('goal-detail', args=[goal.id])).status_code, 404)
+        self.assertEqual(self.client.delete(reverse('dailyplan-detail', args=[plan.id])).status_code, 404)
+        self.assertTrue(DailyPlan.objects.filter(pk=plan.id).exists())
+
+    def test_missing_rows_give_the_same_404_for_every_method(self):
+        for name, detail in (('goal-detail', "Goal not found"), ('dailyplan-detail', "Daily plan not found")):
+            url = reverse(name, args=[999])
+            for method in (self.client.get, self.client.put, self.client.patch, self.client.delete):
+                response = method(url, {}, format='json')
+                self.assertEqual((response.status_code, response.json()), (404, {"detail": detail}))
+
+
+class DailyPlanCreateTests(LoggedInApiTestCase):
+    def setUp(self):
+        super().setUp()
+        self.goal = Goal.objects.create(user=self.user, title="Python", deadline="2025-12-31")
+
+    def test_create_single_plan(self):
+        payload = {"date": "2025-12-01", "goal": self.goal.id, "topics": "lists", "planned_hours": 2}
+        response = self.client.post(reverse('daily-plans'), payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["goal_title"], "python")
+        self.assertEqual(DailyPlan.objects.get().user, self.user)
+
+    def test_create_batch(self):
+        payload = [
+            {"date": "2025-12-01", "goal": self.goal.id, "topics": "lists"},
+            {"date": "2025-12-02", "goal": self.goal.id, "topics": "tuples"},
+        ]
+        response = self.client.post(reverse('daily-plans'), payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(DailyPlan.objects.filter(user=self.user).count(), 2)
+        self.assertEqual(
+            [row["id"] for row in response.json()],
+            list(DailyPlan.objects.order_by("date").values_list("id", flat=True)),
+        )
+
+    def test_overlapping_batches_get_their_own_ids(self):
+        # MySQL cannot return ids from a bulk INSERT; another batch for the
+        # same (goal, date) lands between this batch's rows
+        payload = [
+            {"date": "2025-12-01", "goal": self.goal.id, "topics": "lists"},
+            {"date": "2025-12-01", "goal": self.goal.id, "topics": "tuples"},
+        ]
+        overlapped = []
+
+        def other_tab_inserts_after_first_insert(execute, sql, params, many, context):
+            result = execute(sql, params, many, context)
+            if sql.startswith("INSERT") and DailyPlan._meta.db_table in sql and not overlapped:
+                overlapped.append(True)
+                DailyPlan.objects.bulk_create([
+                    DailyPlan(user=self.user, goal=self.goal, date="2025-12-01", topics="other tab"),
+                    DailyPlan(user=self.user, goal=self.goal, date="2025-12-01", topics="other tab"),
+                ])
+            return result
+
+        features = type(connection.features)
+        with mock.patch.object(features, "can_return_rows_from_bulk_insert", mock.PropertyMock(return_value=False)), \
+                connection.execute_wrapper(other_tab_inserts_after_first_insert):
+            response = self.client.post(reverse('daily-plans'), payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            [DailyPlan.objects.get(pk=row["id"]).topics for row in response.json()],
+            ["lists", "tuples"],
+        )
+        self.assertEqual(DailyPlan.objects.filter(topics="other tab").count(), 2)
+
+    def test_rejects_other_users_goal(self):
+        other = UserRegistration.objects.create(name="Other", email="other@example.com", password="x")
+        goal = Goal.objects.create(user=other, title="Private", deadline="2025-12-31")
+        payload = {"date": "2025-12-01", "goal": goal.id, "topics": "lists"}
+        response = self.client.post(reverse('daily-plans'), payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class DetailUpdateTests(LoggedInApiTestCase):
+    def test_goal_update_keeps_owner_and_validates_body(self):
+        other = UserRegistration.objects.create(name="Other", email="other@example.com", password="x")
+        goal = Goal.objects.create(user=self.user, title="Python", deadline="2025-12-31")
+        Goal.objects.create(user=self.user, title="Rust", deadline="2025-12-31")
+        url = reverse('goal-detail', args=[goal.id])
+
+        response = self.client.patch(url, {"user": other.id, "total_hours": 5}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        goal.refresh_from_db()
+        self.assertEqual((goal.user_id, goal.total_hours), (self.user.id, 5))
+
+        self.assertEqual(self.client.patch(url, [1], format='json').status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.patch(url, {"title": "rust"}, format='json').status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_patch_only_writes_changed_columns(self):
+        goal = Goal.objects.create(user=self.user, title="Python", deadline="2025-12-31")
+        plan = DailyPlan.objects.create(user=self.user, goal=goal, date="2025-12-01", topics="lists")
+        # Changed behind the serializer's back; a full-row UPDATE would revert it
+        DailyPlan.objects.filter(pk=plan.pk).update(topics="edited elsewhere")
+
+        response = self.client.patch(reverse('dailyplan-detail', args=[plan.id]), {"is_completed": True}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        plan.refresh_from_db()
+        self.assertTrue(plan.is_completed)
+        self.assertEqual(plan.topics, "edited elsewhere")
+        self.assertGreater(plan.updated_at, plan.created_at)
+
+    def test_goal_title_is_still_normalized(self):
+        goal = Goal.objects.create(user=self.user, title="Python", deadline="2025-12-31")
+        self.client.patch(reverse('goal-detail', args=[goal.id]), {"title": "  Rust "}, format='json')
+        goal.refresh_from_db()
+        self.assertEqual(goal.title, "rust")
+
+
+class DailyPlanQueryCountTests(LoggedInApiTestCase):
+    """One query for the cookie user, one for the plans and their goals
+    (plus, on the list, one aggregate for the ETag)."""
+
+    def setUp(self):
+        super().setUp()
+        for i in range(5):
+            goal = Goal.objects.create(user=self.user, title=f"Goal {i}", deadline="2025-12-31")
+            self.plan = DailyPlan.objects.create(user=self.user, goal=goal, date="2025-12-01", topics="lists")
+
+    def test_list_does_not_query_per_goal(self):
+        with self.assertNumQueries(3):
+            rows = streamed_json(self.client.get(reverse('daily-plans')))
+        self.assertEqual(len(rows), 5)
+
+    def test_delete_is_a_single_statement(self):
+        with self.assertNumQueries(2):
+            response = self.client.delete(reverse('dailyplan-detail', args=[self.plan.id]))
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(self.client.delete(reverse('dailyplan-detail', args=[self.plan.id])).status_code, 404)
+
+    def test_detail_joins_goal(self):
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('dailyplan-detail', args=[self.plan.id]))
+        self.assertEqual(response.data["goal_title"], "goal 4")
+
+
+class ConditionalGetTests(LoggedInApiTestCase):
+    def setUp(self):
+        super().setUp()
+        self.goal = Goal.objects.create(user=self.user, title="Python", deadline="2025-12-31")
+        self.plan = DailyPlan.objects.create(user=self.user, goal=self.goal, date="2025-12-01", topics="lists")
+
+    def assertRevalidates(self, url):
+        etag = self.client.get(url)["ETag"]
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response["Cache-Control"], "private, no-cache")
+        return etag
+
+    def test_goal_list_etag_changes_on_delete(self):
+        url = reverse('goals')
+        etag = self.assertRevalidates(url)
+        Goal.objects.create(user=self.user, title="Rust", deadline="2025-12-31").delete()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        self.goal.delete()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_daily_plan_list_etag_changes_on_goal_rename(self):
+        url = reverse('daily-plans')
+        etag = self.assertRevalidates(url)
+        self.goal.title = "Django"
+        self.goal.save()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_detail_views_revalidate(self):
+        self.assertRevalidates(reverse('goal-detail', args=[self.goal.id]))
+        etag = self.assertRevalidates(reverse('dailyplan-detail', args=[self.plan.id]))
+        self.client.patch(reverse('dailyplan-detail', args=[self.plan.id]), {"is_completed": True}, format='json')
+        response = self.client.get(reverse('dailyplan-detail', args=[self.plan.id]), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+
+class ListPaginationTests(LoggedInApiTestCase):
+    def setUp(self):
+        super().setUp()
+        for i in range(3):
+            goal = Goal.objects.create(user=self.user, title=f"Goal {i}", deadline="2025-12-31")
+            DailyPlan.objects.create(user=self.user, goal=goal, date=f"2025-12-0{i + 1}", topics="lists")
+
+    def test_lists_are_unpaginated_by_default(self):
+        self.assertEqual(len(self.client.get(reverse('goals')).data), 3)
+        self.assertEqual(len(streamed_json(self.client.get(reverse('daily-plans')))), 3)
+
+    def test_goal_list_rows_match_serializer_fields(self):
+        row = self.client.get(reverse('goals')).json()[0]
+        self.assertEqual(set(row), set(GoalSerializer.Meta.fields))
+        self.assertEqual(row["status"], "In Progress")
+        self.assertEqual(row, GoalSerializer(Goal.objects.get(pk=row["id"])).data)
+
+    def test_daily_plan_list_streams_without_buffering_under_wsgi(self):
+        response = self.client.get(reverse('daily-plans'))
+        self.assertTrue(response.streaming)
+        self.assertFalse(response.is_async)
+        self.assertEqual(len(streamed_json(response)), 3)
+
+    async def test_daily_plan_list_streams_under_asgi(self):
+        self.async_client.cookies = self.client.cookies
+        response = await self.async_client.get(reverse('daily-plans'))
+        self.assertTrue(response.streaming)
+        self.assertTrue(response.is_async)
+        body = b"".join([chunk async for chunk in response.streaming_content])
+        self.assertEqual([row["date"] for row in json.loads(body)], ["2025-12-01", "2025-12-02", "2025-12-03"])
+
+    def test_daily_plan_list_rows_match_serializer_fields(self):
+        row = streamed_json(self.client.get(reverse('daily-plans')))[0]
+        self.assertEqual(set(row), set(DailyPlanSerializer.Meta.fields))
+        self.assertEqual(row["goal_title"], "goal 0")
+
+    def test_goal_list_cursor(self):
+        response = self.client.get(reverse('goals'), {"page_size": 2})
+        self.assertEqual([g["title"] for g in response.data["results"]], ["goal 2", "goal 1"])
+
+        response = self.client.get(response.data["next"])
+        self.assertEqual([g["title"] for g in response.data["results"]], ["goal 0"])
+
+    def test_daily_plan_list_cursor(self):
+        response = self.client.get(reverse('daily-plans'), {"page_size": 2})
+        self.assertEqual(len(response.data["results"]), 2)
+        self.assertIsNotNone(response.data["next"])
+
+        response = self.client.get(response.data["next"])
+        self.assertEqual([p["date"] for p in response.json()["results"]], ["2025-12-03"])
+
+
+class DailyPlanDateFilterTests(LoggedInApiTestCase):
+    def setUp(self):
+        super().setUp()
+        goal = Goal.objects.create(user=self.user, title="Python", deadline="2025-12-31")
+        for day in ("2025-12-01", "2025-12-02", "2025-12-03"):
+            DailyPlan.objects.create(user=self.user, goal=goal, date=day, topics="lists")
+
+    def test_filters_inclusive_range(self):
+        rows = streamed_json(self.client.get(reverse('daily-plans'), {"start": "2025-12-02", "end": "2025-12-03"}))
+        self.assertEqual([row["date"] for row in rows], ["2025-12-02", "2025-12-03"])
+
+        rows = streamed_json(self.client.get(reverse('daily-plans'), {"end": "2025-12-01"}))
+        self.assertEqual([row["date"] for row in rows], ["2025-12-01"])
+
+    def test_rejects_malformed_dates_before_querying_plans(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('daily-plans'), {"start": "12/01/2025"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+@override_settings(GEMINI_API_KEY="test-key")
+class AiGeneratePlanTests(LoggedInApiTestCase):
+    def setUp(self):
+        super().setUp()
+        self.goal = Goal.objects.create(user=self.user, title="Python", description="lists", deadline="2025-12-31")
+        self.gemini = mock.MagicMock()
+        self.gemini.aio.models.generate_content = mock.AsyncMock(
+            return_value=mock.Mock(text="Day 1: lists\nDay 2: tuples")
+        )
+        patcher = mock.patch('planner.views.get_genai_client', return_value=self.gemini)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        cache.clear()
+
+    def test_returns_generated_plan(self):
+        response = self.client.post(reverse('ai-generate-plan'), {"goal_id": self.goal.id, "days": 2}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["plan"], "Day 1: lists\nDay 2: tuples")
+
+    def test_plan_is_cached_until_goal_changes(self):
+        url = reverse('ai-generate-plan')
+        payload = {"goal_id": self.goal.id, "days": 2}
+        self.client.post(url, payload, format='json')
+        response = self.client.post(url, payload, format='json')
+        self.assertEqual(response.json()["plan"], "Day 1: lists\nDay 2: tuples")
+        self.assertEqual(self.gemini.aio.models.generate_content.await_count, 1)
+
+        self.goal.description = "dicts"
+        self.goal.save()
+        self.client.post(url, payload, format='json')
+        self.assertEqual(self.gemini.aio.models.generate_content.await_count, 2)
+
+    def test_rejects_non_numeric_days(self):
+        response = self.client.post(reverse('ai-generate-plan'), {"goal_id": self.goal.id, "days": "abc"}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("days", response.json())
+        self.gemini.aio.models.generate_content.assert_not_called()
+
+    def test_unknown_goal(self):
+        response = self.client.post(reverse('ai-generate-plan'), {"goal_id": 999, "days": 2}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_waits_for_inflight_generation(self):
+        cache_key = f"aiplan:{self.goal.pk}:{self.goal.updated_at.timestamp()}:2"
+        cache.set(f"{cache_key}:lock", 1)
+
+        async def other_request_finishes(_):
+            await cache.aset(cache_key, "Day 1: sets\nDay 2: dicts")
+
+        with mock.patch('planner.views.asyncio.sleep', side_effect=other_request_finishes):
+            response = self.client.post(reverse('ai-generate-plan'), {"goal_id": self.goal.id, "days": 2}, format='json')
+        self.assertEqual(response.json()["plan"], "Day 1: sets\nDay 2: dicts")
+        self.gemini.aio.models.generate_content.assert_not_called()
+
+    def test_lock_is_released_after_generation(self):
+        self.client.post(reverse('ai-generate-plan'), {"goal_id": self.goal.id, "days": 2}, format='json')
+        cache_key = f"aiplan:{self.goal.pk}:{self.goal.updated_at.timestamp()}:2"
+        self.assertIsNone(cache.get(f"{cache_key}:lock"))
+
+    @override_settings(GEMINI_API_KEY=None)
+    def test_missing_api_key(self):
+        response = self.client.post(reverse('ai-generate-plan'), {"goal_id": self.goal.id, "days": 2}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+        self.gemini.aio.models.generate_content.assert_not_called()
+
+    async def test_streams_plan_when_asked(self):
+        async def chunks():
+            for text in ("Day 1: lists\n", "Day 2: tuples"):
+                yield mock.Mock(text=text)
+
+        self.gemini.aio.models.generate_content_stream = mock.AsyncMock(return_value=chunks())
+        self.async_client.cookies = self.client.cookies
+        response = await self.async_client.post(
+            reverse('ai-generate-plan'),
+            {"goal_id": self.goal.id, "days": 2, "stream": True},
+            content_type='application/json',
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        body = b"".join([chunk async for chunk in response.streaming_content])
+        self.assertEqual(body, b"Day 1: lists\nDay 2: tuples")
+        self.gemini.aio.models.generate_content.assert_not_called()
+
+        # The streamed plan lands in the cache like a buffered one
+        response = await self.async_client.post(
+            reverse('ai-generate-plan'),
+            {"goal_id": self.goal.id, "days": 2},
+            content_type='application/json',
+        )
+        self.assertEqual(response.json()["plan"], "Day 1: lists\nDay 2: tuples")
+
+    async def test_empty_stream_is_not_cached(self):
+        async def chunks():
+            yield mock.Mock(text=None)
+
+        self.gemini.aio.models.generate_content_stream = mock.AsyncMock(return_value=chunks())
+        self.async_client.cookies = self.client.cookies
+        response = await self.async_client.post(
+            reverse('ai-generate-plan'),
+            {"goal_id": self.goal.id, "days": 2, "stream": True},
+            content_type='application/json',
+        )
+        self.assertEqual(b"".join([chunk async for chunk in response.streaming_content]), b"")
+
+        response = await self.async_client.post(
+            reverse('ai-generate-plan'),
+            {"goal_id": self.goal.id, "days": 2},
+            content_type='application/json',
+        )
+        self.assertEqual(response.json()["plan"], "Day 1: lists\nDay 2: tuples")
+        self.gemini.aio.models.generate_content.assert_awaited_once()
+
+
+class AddAiPlanToDailyScheduleTests(LoggedInApiTestCase):
+    def setUp(self):
+        super().setUp()
+        self.goal = Goal.objects.create(user=self.user, title="Python", deadline="2025-12-31")
+
+    def test_creates_one_plan_per_day(self):
+        url = reverse('ai-add-to-daily-plan')
+        payload = {"goal_id": self.goal.id, "plan": "Day 1: lists\nnoise\nDay 2: tuples"}
+        response = self.client.post(url, payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["total_days"], 2)
+        self.assertEqual(
+            list(DailyPlan.objects.filter(goal=self.goal).order_by("date").values_list("topics", flat=True)),
+            ["lists", "tuples"],
+        )
+
+        response = self.client.post(url, payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+
+    def test_schedules_from_start_date(self):
+        url = reverse('ai-add-to-daily-plan')
+        payload = {"goal_id": self.goal.id, "plan": "Day 1: lists\nDay 2: tuples", "start_date": "2025-12-31"}
+        self.assertEqual(self.client.post(url, payload, format='json').status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            [d.isoformat() for d in DailyPlan.objects.order_by("date").values_list("date", flat=True)],
+            ["2025-12-31", "2026-01-01"],
+        )
+
+    def test_rejects_bad_start_date(self):
+        url = reverse('ai-add-to-daily-plan')
+        payload = {"goal_id": self.goal.id, "plan": "Day 1: lists", "start_date": "31/12/2025"}
+        self.assertEqual(self.client.post(url, payload, format='json').status_code, status.HTTP_400_BAD_REQUEST)
@@ -1,30 +1,153 @@
 """Clean and simple API views for the learning planner backend."""
 
 from datetime import date
-from rest_framework import status
+from rest_framework import generics, serializers, status
+from rest_framework.exceptions import APIException, NotFound
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.decorators import api_view
+import hashlib
+from django.core.handlers.asgi import ASGIRequest
+from django.db.models import Count, F, Max
+from django.http import Http404, StreamingHttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
 from django.views.decorators.csrf import csrf_exempt
 
 from .models import Goal, DailyPlan
-from .serializers import GoalSerializer, DailyPlanSerializer
+from .serializers import GoalSerializer, GoalUpdateSerializer, DailyPlanSerializer
 from .ai_service import generate_schedule
+from .pagination import GoalPagination, DailyPlanPagination
+from .renderers import ORJSONRenderer
+
+
+# ---------------------------------------------------------
+# CONDITIONAL GET (ETag / Last-Modified)
+# ---------------------------------------------------------
+
+def make_etag(*parts):
+    digest = hashlib.md5(":".join(map(str, parts)).encode(), usedforsecurity=False)
+    return quote_etag(digest.hexdigest())
+
+
+def with_validators(response, etag, last_modified=None):
+    response.headers["ETag"] = etag
+    if last_modified:
+        response.headers["Last-Modified"] = http_date(last_modified.timestamp())
+    # Per-user data: browsers may keep it but must revalidate every time
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+def not_modified(request, etag, last_modified=None):
+    """Return a 304 if the client's cached copy is current, else None."""
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+    if response is None:
+        return None
+    # A 304 must repeat the ETag and Cache-Control the 200 would have sent
+    return with_validators(response, etag, last_modified)
+
+
+# ---------------------------------------------------------
+# AUTH FOR GENERIC VIEWS
+# ---------------------------------------------------------
+
+class Unauthorized(APIException):
+    # Not NotAuthenticated: DRF downgrades that to 403 without a
+    # WWW-Authenticate header, and the cookie auth has none to offer
+    status_code = 401
+    default_detail = "Unauthorized"
+
+
+class LoggedInUserMixin:
+    """Resolves the cookie user once per request as `self.user`."""
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self.user = get_logged_in_user(request)
+        if not self.user:
+            raise Unauthorized()
+
+    def get_serializer_context(self):
+        return {**super().get_serializer_context(), "user": self.user}
+
+
+class OwnedObjectMixin:
+    """Detail-view 404s carry `not_found_detail`; DELETE is a single statement."""
+    not_found_detail = "Not found"
+
+    def get_object(self):
+        try:
+            return super().get_object()
+        except Http404:
+            raise NotFound(self.not_found_detail)
+
+    def destroy(self, request, *args, **kwargs):
+        # No SELECT first: the affected row count doubles as the 404 check
+        deleted, _ = self.get_queryset().filter(pk=kwargs["pk"]).delete()
+        if not deleted:
+            raise NotFound(self.not_found_detail)
+        return Response(status=204)
 
 
 # ---------------------------------------------------------
 # GOAL CRUD
 # ---------------------------------------------------------
 
+# Same keys as GoalSerializer, read straight from .values() for the list
+GOAL_FIELDS = (
+    'id',
+    'user',
+    'title',
+    'description',
+    'deadline',
+    'total_hours',
+    'is_completed',
+    'created_at',
+    'updated_at',
+)
+
+
+# GoalSerializer's rendering of created_at/updated_at (local TIME_ZONE offset)
+_DATETIME_FIELD = serializers.DateTimeField()
+
+
+def goal_rows(rows):
+    """Render Goal `.values()` rows exactly as GoalSerializer would."""
+    to_representation = _DATETIME_FIELD.to_representation
+    rows = list(rows)
+    for row in rows:
+        row["created_at"] = to_representation(row["created_at"])
+        row["updated_at"] = to_representation(row["updated_at"])
+        row["status"] = "Completed" if row["is_completed"] else "In Progress"
+    return rows
+
+
 class GoalListCreateView(APIView):
     def get(self, request):
         user = get_logged_in_user(request)
         if not user:
             return Response({"detail": "Unauthorized"}, status=401)
 
-        goals = Goal.objects.filter(user=user).order_by('-created_at')
-        serializer = GoalSerializer(goals, many=True)
-        return Response(serializer.data)
+        goals = Goal.objects.filter(user=user)
+
+        # ETag only: max(updated_at) alone would not change on delete
+        version = goals.aggregate(count=Count("id"), last=Max("updated_at"))
+        etag = make_etag(request.get_full_path(), version["count"], version["last"])
+        cached = not_modified(request, etag)
+        if cached:
+            return cached
+
+        # Plain dicts: no model instances or serializer fields per row
+        goals = goals.order_by('-created_at').values(*GOAL_FIELDS)
+
+        paginator = GoalPagination()
+        page = paginator.paginate_queryset(goals, request, view=self)
+        if page is not None:
+            return with_validators(paginator.get_paginated_response(goal_rows(page)), etag)
+
+        return with_validators(Response(goal_rows(goals)), etag)
 
     def post(self, request):
         user = get_logged_in_user(request)
@@ -43,140 +166,198 @@ class GoalListCreateView(APIView):
 
 
 
-class GoalDetailView(APIView):
+class GoalDetailView(LoggedInUserMixin, OwnedObjectMixin, generics.RetrieveUpdateDestroyAPIView):
     """GET -> Retrieve single goal
        PUT -> Update goal fully
        PATCH -> Partial update
        DELETE -> Delete goal
     """
+    serializer_class = GoalSerializer
+    not_found_detail = "Goal not found"
 
-    def get_object(self, pk):
-        try:
-            return Goal.objects.get(pk=pk)
-        except Goal.DoesNotExist:
-            return None
+    def get_queryset(self):
+        return Goal.objects.filter(user=self.user)
 
-    def get(self, request, pk):
-        goal = self.get_object(pk)
-        if not goal:
-            return Response({"detail": "Goal not found"}, status=404)
-        serializer = GoalSerializer(goal)
-        return Response(serializer.data)
-
-    def put(self, request, pk):
-        goal = self.get_object(pk)
-        if not goal:
-            return Response({"detail": "Goal not found"}, status=404)
-        serializer = GoalSerializer(goal, data=request.data)
-        if serializer.is_valid():
-            serializer.save()
-            return Response(serializer.data)
-        return Response(serializer.errors, status=400)
+    def get_serializer_class(self):
+        if self.request.method in ("PUT", "PATCH"):
+            return GoalUpdateSerializer
+        return self.serializer_class
 
-    def patch(self, request, pk):
-        goal = self.get_object(pk)
-        if not goal:
-            return Response({"detail": "Goal not found"}, status=404)
-        serializer = GoalSerializer(goal, data=request.data, partial=True)
-        if serializer.is_valid():
-            serializer.save()
-            return Response(serializer.data)
-        return Response(serializer.errors, status=400)
+    def perform_update(self, serializer):
+        # Goals stay with their owner whatever the payload says
+        serializer.save(user=self.user)
 
-    def delete(self, request, pk):
-        goal = self.get_object(pk)
-        if not goal:
-            return Response({"detail": "Goal not found"}, status=404)
-        goal.delete()
-        return Response(status=204)
+    def retrieve(self, request, *args, **kwargs):
+        goal = self.get_object()
+        etag = make_etag(goal.pk, goal.updated_at)
+        cached = not_modified(request, etag, goal.updated_at)
+        if cached:
+            return cached
+
+        serializer = self.get_serializer(goal)
+        return with_validators(Response(serializer.data), etag, goal.updated_at)
 
 
 # ---------------------------------------------------------
 # DAILY PLAN CRUD
 # ---------------------------------------------------------
 
+# DailyPlanSerializer's keys minus goal_title, which the list annotates
+DAILY_PLAN_FIELDS = (
+    'id',
+    'date',
+    'goal',
+    'topics',
+    'planned_hours',
+    'is_completed',
+)
+
+
+def _json_array_chunks(rows, chunk_size):
+    render = ORJSONRenderer().render
+    sep, parts = b"[", []
+    for row in rows.iterator(chunk_size=chunk_size):
+        parts += (sep, render(row))
+        sep = b","
+        if len(parts) >= 2 * chunk_size:
+            yield b"".join(parts)
+            parts = []
+    yield b"".join(parts) + (b"]" if sep == b"," else b"[]")
+
+
+async def _ajson_array_chunks(rows, chunk_size):
+    render = ORJSONRenderer().render
+    sep, parts = b"[", []
+    async for row in rows.aiterator(chunk_size=chunk_size):
+        parts += (sep, render(row))
+        sep = b","
+        if len(parts) >= 2 * chunk_size:
+            yield b"".join(parts)
+            parts = []
+    yield b"".join(parts) + (b"]" if sep == b"," else b"[]")
+
+
+def stream_json_array(rows, asynchronous, chunk_size=500):
+    """Streams a values() queryset as a JSON array, chunk_size rows at a time.
+
+    Django buffers async iterators in full under WSGI and sync ones under
+    ASGI, so pass `asynchronous` to match the server.
+
+    This bounds the Python row dicts and the encoded output, not the driver:
+    mysqlclient's default cursor still fetches the whole result set into
+    client memory. Real end-to-end streaming needs a server-side cursor
+    (MySQLdb's SSCursor).
+    """
+    if asynchronous:
+        chunks = _ajson_array_chunks(rows, chunk_size)
+    else:
+        chunks = _json_array_chunks(rows, chunk_size)
+    return StreamingHttpResponse(chunks, content_type="application/json")
+
+
+def date_param(request, name):
+    """`?name=YYYY-MM-DD` as a date, or None when absent; ValueError if malformed."""
+    value = request.query_params.get(name)
+    return date.fromisoformat(value) if value else None
+
+
 class DailyPlanListCreateView(APIView):
     """GET -> List daily plans (with optional date filters)
-       POST -> Create new daily plan
+       POST -> Create new daily plan, or a batch when given a JSON array
     """
 
+    def dispatch(self, request, *args, **kwargs):
+        # Django's own request, before DRF wraps it: picks the list stream
+        self.served_over_asgi = isinstance(request, ASGIRequest)
+        return super().dispatch(request, *args, **kwargs)
+
     def get(self, request):
       user = get_logged_in_user(request)
       if not user:
           return Response({"detail": "Unauthorized"}, status=401)
 
-      plans = DailyPlan.objects.filter(user=user).order_by("date")
-      serializer = DailyPlanSerializer(plans, many=True)
-      return Response(serializer.data)
+      # Optional inclusive ?start=&end= range, parsed up front so bad input
+      # is rejected before any query runs
+      try:
+          start = date_param(request, "start")
+          end = date_param(request, "end")
+      except ValueError:
+          return Response({"detail": "start and end must be YYYY-MM-DD"}, status=400)
+
+      plans = DailyPlan.objects.filter(user=user)
+      if start:
+          plans = plans.filter(date__gte=start)
+      if end:
+          plans = plans.filter(date__lte=end)
+
+      # goal_title is part of each row, so goal edits count as a change too
+      version = plans.aggregate(
+          count=Count("id"), last=Max("updated_at"), last_goal=Max("goal__updated_at")
+      )
+      etag = make_etag(request.get_full_path(), version["count"], version["last"], version["last_goal"])
+      cached = not_modified(request, etag)
+      if cached:
+          return cached
+
+      # Plain dicts with goal_title joined in: no instances, no serializer
+      plans = (
+          plans.order_by("date")
+          .values(*DAILY_PLAN_FIELDS, goal_title=F("goal__title"))
+      )
+
+      paginator = DailyPlanPagination()
+      page = paginator.paginate_queryset(plans, request, view=self)
+      if page is not None:
+          return with_validators(paginator.get_paginated_response(page), etag)
+
+      # Unpaginated ranges can be large; encode and send them in chunks
+      # rather than building one list of every row
+      return with_validators(stream_json_array(plans, self.served_over_asgi), etag)
 
     def post(self, request):
         user = get_logged_in_user(request)
         if not user:
             return Response({"detail": "Unauthorized"}, status=401)
 
-        data = request.data.copy()
-        data["user"] = user.id
-
-        serializer = DailyPlanSerializer(data=data)
+        # A JSON array creates the whole batch in one bulk INSERT
+        many = isinstance(request.data, list)
+        serializer = DailyPlanSerializer(data=request.data, many=many, context={"user": user})
         if serializer.is_valid():
-            serializer.save()
+            serializer.save(user=user)
             return Response(serializer.data, status=201)
         return Response(serializer.errors, status=400)
 
 
 
-class DailyPlanDetailView(APIView):
+class DailyPlanDetailView(LoggedInUserMixin, OwnedObjectMixin, generics.RetrieveUpdateDestroyAPIView):
     """GET -> Retrieve daily plan
        PUT -> Update
        PATCH -> Partial update
        DELETE -> Delete
     """
+    serializer_class = DailyPlanSerializer
+    not_found_detail = "Daily plan not found"
 
-    def get_object(self, pk):
-        try:
-            return DailyPlan.objects.get(pk=pk)
-        except DailyPlan.DoesNotExist:
-            return None
+    def get_queryset(self):
+        return DailyPlan.objects.filter(user=self.user).select_related('goal')
 
-    def get(self, request, pk):
-        plan = self.get_object(pk)
-        if not plan:
-            return Response({"detail": "Daily plan not found"}, status=404)
-        serializer = DailyPlanSerializer(plan)
-        return Response(serializer.data)
-
-    def put(self, request, pk):
-        plan = self.get_object(pk)
-        if not plan:
-            return Response({"detail": "Daily plan not found"}, status=404)
-        serializer = DailyPlanSerializer(plan, data=request.data)
-        if serializer.is_valid():
-            serializer.save()
-            return Response(serializer.data)
-        return Response(serializer.errors, status=400)
-
-    def patch(self, request, pk):
-        plan = self.get_object(pk)
-        if not plan:
-            return Response({"detail": "Daily plan not found"}, status=404)
-        serializer = DailyPlanSerializer(plan, data=request.data, partial=True)
-        if serializer.is_valid():
-            serializer.save()
-            return Response(serializer.data)
-        return Response(serializer.errors, status=400)
+    def retrieve(self, request, *args, **kwargs):
+        plan = self.get_object()
+        goal_updated_at = plan.goal.updated_at if plan.goal else plan.updated_at
+        last_modified = max(plan.updated_at, goal_updated_at)
+        etag = make_etag(plan.pk, plan.updated_at, goal_updated_at)
+        cached = not_modified(request, etag, last_modified)
+        if cached:
+            return cached
 
-    def delete(self, request, pk):
-        plan = self.get_object(pk)
-        if not plan:
-            return Response({"detail": "Daily plan not found"}, status=404)
-        plan.delete()
-        return Response(status=204)
+        serializer = self.get_serializer(plan)
+        return with_validators(Response(serializer.data), etag, last_modified)
 
 
 # ---------------------------------------------------------
 # AI PLAN GENERATOR
 # ---------------------------------------------------------
-import os
+from django.conf import settings
 from google import genai
 from google.genai.errors import APIError
 from rest_framework.decorators import api_view
@@ -184,44 +365,44 @@ from rest_framework.response import Response
 from rest_framework import status
 from .models import Goal
 
-import environ
-env=environ.Env()
-environ.Env.read_env()
+import asyncio
+import httpx
+import orjson
+from django.core.cache import cache
+from django.http import HttpResponse
 
-from datetime import date, timedelta
+from datetime import date
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 
 from .models import UserRegistration, Goal, DailyPlan
-from .serializers import DailyPlanSerializer
+from .serializers import DailyPlanSerializer, AIGeneratePlanRequestSerializer
 
-@api_view(['POST'])
-def ai_generate_plan(request):
-    """
-    AI-powered study plan generator using Google Gemini (google-genai SDK).
-    User sends: goal_id, days
-    """
-    user = get_logged_in_user(request)
-    if not user:
-       return Response({"detail": "Unauthorized"}, status=401)
-    goal_id = request.data.get("goal_id")
-    days = request.data.get("days")
+def orjson_response(data, status=200):
+    """JsonResponse equivalent for the plain (non-DRF) async view."""
+    return HttpResponse(orjson.dumps(data), status=status, content_type="application/json")
 
-    if not goal_id or not days:
-        return Response({"detail": "goal_id and days are required"}, status=400)
 
-    # Fetch the goal
-    try:
-       goal = Goal.objects.get(id=goal_id, user=user)
-    except Goal.DoesNotExist:
-        return Response({"detail": "Goal not found"}, status=404)
+# One Gemini client per worker process, so its HTTP connection pool
+# (and TLS session) is reused across requests.
+_GENAI_CLIENT = None
+
+
+def get_genai_client(api_key):
+    global _GENAI_CLIENT
+    if _GENAI_CLIENT is None:
+        _GENAI_CLIENT = genai.Client(api_key=api_key)
+    return _GENAI_CLIENT
 
-    # Get title and topics from DB
-    title = goal.title
-    user_topic = goal.description
 
-    prompt = f"""
+# Generated plans are reused for a day while the goal stays unchanged
+AI_PLAN_CACHE_TIMEOUT = 60 * 60 * 24
+AI_PLAN_LOCK_TIMEOUT = 30
+AI_PLAN_POLL_INTERVAL = 0.25
+GEMINI_MODEL = "gemini-2.5-flash"
+
+PROMPT_TEMPLATE = """
 Generate a study plan for the goal: {title}.
 Main topic: {user_topic}.
 
@@ -241,46 +422,160 @@ Rules:
 """
 
 
-    # Get API key (you can store directly or use environment variable)
-    # api_key = os.getenv("GEMINI_API_KEY")
-    api_key = env("GEMINI_API_KEY")
+def plan_response(plan, stream):
+    if stream:
+        return HttpResponse(plan, content_type="text/plain; charset=utf-8")
+    return orjson_response({"plan": plan})
+
+
+async def await_plan(cache_key, lock_key):
+    """Polls for a plan another request is generating; None if it never lands."""
+    for _ in range(int(AI_PLAN_LOCK_TIMEOUT / AI_PLAN_POLL_INTERVAL)):
+        await asyncio.sleep(AI_PLAN_POLL_INTERVAL)
+        plan = await cache.aget(cache_key)
+        if plan is not None:
+            return plan
+        if not await cache.ahas_key(lock_key):
+            # The holder failed without caching anything
+            return None
+    return None
+
+
+async def stream_plan(chunks, cache_key, lock_key=None):
+    """Relays Gemini chunks as they arrive and caches the whole plan at the end."""
+    parts = []
+    try:
+        async for chunk in chunks:
+            if chunk.text:
+                parts.append(chunk.text)
+                yield chunk.text
+        # An empty stream is a miss, as result.text=None is on the buffered path
+        if parts:
+            await cache.aset(cache_key, "".join(parts), AI_PLAN_CACHE_TIMEOUT)
+    finally:
+        if lock_key:
+            await cache.adelete(lock_key)
+
+
+@csrf_exempt
+async def ai_generate_plan(request):
+    """
+    AI-powered study plan generator using Google Gemini (google-genai SDK).
+    User sends: goal_id, days, optional stream
+
+    With "stream": true the plan comes back as text/plain, written chunk by
+    chunk as Gemini produces it, instead of one JSON {"plan": ...} body.
+
+    Async so the Gemini round-trip (seconds) does not pin a worker; serve
+    the project through learnflow.asgi to get the benefit.
+    """
+    if request.method != "POST":
+        return orjson_response({"detail": "Only POST allowed"}, status=405)
+
+    user = await aget_logged_in_user(request)
+    if not user:
+        return orjson_response({"detail": "Unauthorized"}, status=401)
+
+    try:
+        data = orjson.loads(request.body)
+    except orjson.JSONDecodeError:
+        return orjson_response({"detail": "Request body must be valid JSON"}, status=400)
+
+    serializer = AIGeneratePlanRequestSerializer(data=data)
+    if not serializer.is_valid():
+        return orjson_response(serializer.errors, status=400)
+
+    goal_id = serializer.validated_data["goal_id"]
+    days = serializer.validated_data["days"]
+    stream = serializer.validated_data["stream"]
+
+    # Fetch the goal
+    try:
+        goal = await Goal.objects.aget(id=goal_id, user=user)
+    except Goal.DoesNotExist:
+        return orjson_response({"detail": "Goal not found"}, status=404)
+
+    # Any edit to the goal bumps updated_at, which retires the cached plan
+    cache_key = f"aiplan:{goal.pk}:{goal.updated_at.timestamp()}:{days}"
+    cached_plan = await cache.aget(cache_key)
+    if cached_plan is not None:
+        return plan_response(cached_plan, stream)
+
+    # Get title and topics from DB
+    title = goal.title
+    user_topic = goal.description
+
+    prompt = PROMPT_TEMPLATE.format_map({"title": title, "user_topic": user_topic, "days": days})
+
+
+    # Read from .env once, in settings
+    api_key = settings.GEMINI_API_KEY
 
     if not api_key:
-        return Response({"detail": "GEMINI_API_KEY not set in server environment"}, status=500)
+        return orjson_response({"detail": "GEMINI_API_KEY not set in server environment"}, status=500)
+
+    # Single flight: concurrent requests for the same plan share one Gemini call
+    lock_key = f"{cache_key}:lock"
+    locked = await cache.aadd(lock_key, 1, AI_PLAN_LOCK_TIMEOUT)
+    if not locked:
+        cached_plan = await await_plan(cache_key, lock_key)
+        if cached_plan is not None:
+            return plan_response(cached_plan, stream)
 
     try:
-        # Initialize Gemini client
-        client = genai.Client(api_key=api_key)
+        client = get_genai_client(api_key)
+
+        if stream:
+            chunks = await client.aio.models.generate_content_stream(
+                model=GEMINI_MODEL,
+                contents=prompt,
+            )
+            response = StreamingHttpResponse(
+                stream_plan(chunks, cache_key, lock_key if locked else None),
+                content_type="text/plain; charset=utf-8",
+            )
+            # The stream releases the lock once Gemini is done
+            locked = False
+            return response
 
         # Generate content using your stable model
-        result = client.models.generate_content(
-            model="gemini-2.5-flash",
+        result = await client.aio.models.generate_content(
+            model=GEMINI_MODEL,
             contents=prompt,
         )
 
         # Extract result text
         ai_text = result.text
+        await cache.aset(cache_key, ai_text, AI_PLAN_CACHE_TIMEOUT)
 
-        return Response({"plan": ai_text})
+        return orjson_response({"plan": ai_text})
 
     except APIError as e:
-        return Response({"detail": f"Gemini API error: {e}"}, status=500)
+        return orjson_response({"detail": f"Gemini API error: {e}"}, status=500)
+
+    except httpx.HTTPError as e:
+        return orjson_response({"detail": f"Could not reach Gemini: {e}"}, status=500)
 
-    except Exception as e:
-        return Response({"detail": f"Unexpected error: {str(e)}"}, status=500)
+    finally:
+        if locked:
+            await cache.adelete(lock_key)
 
 
 
 
 
-from datetime import timedelta
 import re
+from django.db import transaction
+
+# "Day 3: Decorators" -> ("3", "Decorators")
+DAY_LINE_RE = re.compile(r"Day\s*(\d+)\s*:\s*(.+)")
 
 
 @api_view(["POST"])
 def add_ai_plan_to_daily_schedule(request):
     """
-    Takes AI generated plan and schedules it from today onwards.
+    Takes AI generated plan and schedules it from start_date
+    (YYYY-MM-DD, default today) onwards.
 
     Rules:
     - Same goal (case-insensitive) → warn
@@ -301,6 +596,12 @@ def add_ai_plan_to_daily_schedule(request):
             status=400
         )
 
+    start_date = request.data.get("start_date")
+    try:
+        start = date.fromisoformat(start_date) if start_date else date.today()
+    except (TypeError, ValueError):
+        return Response({"detail": "start_date must be YYYY-MM-DD"}, status=400)
+
     # Fetch goal
     try:
         goal = Goal.objects.get(id=goal_id, user=user)
@@ -321,26 +622,25 @@ def add_ai_plan_to_daily_schedule(request):
     ...
     """
 
-    today = date.today()
-    lines = ai_text.strip().splitlines()
-
-    day_counter = 0
-
-    for line in lines:
-        match = re.match(r"Day\s*(\d+)\s*:\s*(.+)", line)
-        if not match:
-            continue
+    matches = map(DAY_LINE_RE.match, ai_text.strip().splitlines())
+    topics = [match.group(2) for match in matches if match]
 
-        day_counter += 1
-        topic = match.group(2)
-
-        DailyPlan.objects.create(
+    base = start.toordinal()
+    plans = [
+        DailyPlan(
             user=user,
             goal=goal,
-            date=today + timedelta(days=day_counter - 1),
+            date=date.fromordinal(base + offset),
             topics=topic,
             planned_hours=5
         )
+        for offset, topic in enumerate(topics)
+    ]
+    day_counter = len(plans)
+
+    # One INSERT for the whole plan instead of one per day
+    with transaction.atomic():
+        DailyPlan.objects.bulk_create(plans, batch_size=500)
 
     return Response(
         {
@@ -353,118 +653,136 @@ def add_ai_plan_to_daily_schedule(request):
 
 
 #----------------------------------------------------------------#
-from django.http import JsonResponse
-from django.views.decorators.csrf import csrf_exempt
-import json
+from django.db import DatabaseError, IntegrityError
 from .models import UserRegistration
+from .serializers import LoginRequestSerializer, RegisterRequestSerializer
 
 
-@csrf_exempt
+@api_view(["POST"])
 def register_user(request):
-    if request.method != "POST":
-        return JsonResponse({"error": "Only POST allowed"}, status=405)
-
+    # Also rejects non-object bodies (e.g. a JSON array) and non-string values
+    serializer = RegisterRequestSerializer(data=request.data)
+    if not serializer.is_valid():
+        return Response({"error": "All fields are required"}, status=400)
+
+    name = serializer.validated_data["name"]
+    email = serializer.validated_data["email"]
+    password = serializer.validated_data["password"]
+
+    # Create user; the unique email constraint rejects duplicates in the
+    # same round-trip, without a racy exists() check first
+    user = UserRegistration(name=name, email=email)
+    user.set_password(password)
     try:
-        data = json.loads(request.body)
-        name = data.get("name")
-        email = data.get("email")
-        password = data.get("password")
-
-        if not name or not email or not password:
-            return JsonResponse({"error": "All fields are required"}, status=400)
-
-        # Check if email exists
-        if UserRegistration.objects.filter(email=email).exists():
-            return JsonResponse({"error": "Email already registered"}, status=400)
-
-        # Create user
-        user = UserRegistration.objects.create(
-            name=name,
-            email=email,
-            password=password
-        )
+        with transaction.atomic():
+            user.save()
+    except IntegrityError:
+        return Response({"error": "Email already registered"}, status=400)
+    except DatabaseError as e:
+        return Response({"error": str(e)}, status=500)
 
-        return JsonResponse({
-            "message": "User registered successfully",
-            "user_id": user.id
-        }, status=201)
-
-    except Exception as e:
-        return JsonResponse({"error": str(e)}, status=500)
+    return Response({
+        "message": "User registered successfully",
+        "user_id": user.id
+    }, status=201)
 
 
 #---------------------------------------------------------------------------#
 import jwt
 import datetime
 SECRET_KEY = 'django-insecure-change-this-key-for-production'
-@csrf_exempt
-def login_user(request):
-    if request.method != "POST":
-        return JsonResponse({"error": "Only POST allowed"}, status=405)
+JWT_ALGORITHM = "HS256"
+# Token and cookie share one lifetime so the browser drops the cookie
+# when the token inside it stops being accepted
+JWT_LIFETIME = datetime.timedelta(minutes=30)
 
-    try:
-        data = json.loads(request.body)
-        email = data.get("email")
-        password = data.get("password")
 
-        if not email or not password:
-            return JsonResponse({"error": "Email and password are required"}, status=400)
+@api_view(["POST"])
+def login_user(request):
+    serializer = LoginRequestSerializer(data=request.data)
+    if not serializer.is_valid():
+        return Response({"error": "Email and password are required"}, status=400)
 
-        # Check user
-        try:
-            user = UserRegistration.objects.get(email=email)
-        except UserRegistration.DoesNotExist:
-            return JsonResponse({"error": "Invalid email or password"}, status=400)
-
-        # Compare raw password (NO HASHING)
-        if user.password != password:
-            return JsonResponse({"error": "Invalid email or password"}, status=400)
-
-        # Generate JWT token
-        payload = {
-            "user_id": user.id,
-            "email": user.email,
-            "exp": datetime.datetime.utcnow() + datetime.timedelta(minutes=30),  # Token expires in 3 days
-            "iat": datetime.datetime.utcnow()
-        }
-
-        token = jwt.encode(payload, SECRET_KEY, algorithm="HS256")
-
-        # Create response
-        response = JsonResponse({
-            "message": "Login successful",
-            "user_id": user.id,
-            "name": user.name,
-            "token": token  # also return token (optional)
-        }, status=200)
-
-        # Set token in HttpOnly cookie
-        response.set_cookie(
+    email = serializer.validated_data["email"]
+    password = serializer.validated_data["password"]
+
+    # Check user
+    try:
+        user = UserRegistration.objects.only("id", "name", "email", "password").get(email=email)
+    except UserRegistration.DoesNotExist:
+        return Response({"error": "Invalid email or password"}, status=400)
+
+    if not user.check_password(password):
+        return Response({"error": "Invalid email or password"}, status=400)
+
+    # Generate JWT token
+    now = datetime.datetime.now(datetime.timezone.utc)
+    payload = {
+        "user_id": user.id,
+        "email": user.email,
+        "exp": now + JWT_LIFETIME,
+        "iat": now
+    }
+
+    token = jwt.encode(payload, SECRET_KEY, algorithm=JWT_ALGORITHM)
+
+    # Create response
+    response = Response({
+        "message": "Login successful",
+        "user_id": user.id,
+        "name": user.name,
+        "token": token  # also return token (optional)
+    }, status=200)
+
+    # Set token in HttpOnly cookie
+    response.set_cookie(
         key="auth_token",
         value=token,
         httponly=True,
         secure=True,      # MUST be True for HTTPS
         samesite="None",
-        # path="/", 
-        max_age=3*24 * 60 * 60
-)
-
-        return response
+        # path="/",
+        max_age=int(JWT_LIFETIME.total_seconds())
+    )
 
-    except Exception as e:
-        return JsonResponse({"error": str(e)}, status=500)
+    return response
 
 
 # 222
 import jwt
-from django.http import JsonResponse
-def get_logged_in_user(request):
+def _token_user_id(request):
     token = request.COOKIES.get("auth_token")
     if not token:
         return None
-    
+
+    try:
+        return jwt.decode(token, SECRET_KEY, algorithms=[JWT_ALGORITHM])["user_id"]
+    except (jwt.InvalidTokenError, KeyError):
+        return None
+
+
+# Views only need the id (for filtering / FKs), not the password hash
+LOGGED_IN_USER_FIELDS = ("id", "name", "email")
+
+
+def get_logged_in_user(request):
+    user_id = _token_user_id(request)
+    if user_id is None:
+        return None
+
+    try:
+        return UserRegistration.objects.only(*LOGGED_IN_USER_FIELDS).get(id=user_id)
+    except UserRegistration.DoesNotExist:
+        return None
+
+
+async def aget_logged_in_user(request):
+    """Async twin of get_logged_in_user, for async views."""
+    user_id = _token_user_id(request)
+    if user_id is None:
+        return None
+
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=["HS256"])
-        return UserRegistration.objects.get(id=payload["user_id"])
-    except:
+        return await UserRegistration.objects.only(*LOGGED_IN_USER_FIELDS).aget(id=user_id)
+    except UserRegistration.DoesNotExist:
         return None